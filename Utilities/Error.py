@@ -14,7 +14,11 @@ __email__ = "jnathandaniell@gmail.com"
 __status__ = "Development"
 
 
+from .profiling import instrument
 
+
+
+@instrument
 class PointError:
     """Class for calculating error at a single point.
     
@@ -90,6 +94,7 @@ class PointError:
 
 
 
+@instrument
 class SeriesError():
     """Class for calculating error and error statistics with a series of data.
 
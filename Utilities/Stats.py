@@ -14,7 +14,11 @@ __email__ = "jnathandaniell@gmail.com"
 __status__ = "Development"
 
 
+from .profiling import instrument
+
+
 # SimpleStats class for single population basic statistics.
+@instrument
 class SimpleStats():
     """Class for producing simple summary statistics.
 
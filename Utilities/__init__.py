@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Utilities package for error statistics, distributions and spheres.
+
+Submodules are imported lazily on first attribute access, so importing the
+package (or only Error and Stats) does not pull in NumPy or matplotlib.
+"""
+
+__author__ = "James Daniell"
+__copyright__ = ""
+__credits__ = ["James Daniell"]
+__license__ = ""
+__version__ = "0.1"
+__maintainer__ = "James Daniell"
+__email__ = "jnathandaniell@gmail.com"
+__status__ = "Development"
+
+
+from ._lazy import attach
+
+
+_submodules = ("Error", "Stats", "utils", "profiling",
+               "stats", "spheres", "jimmyplot")
+_attrs = {
+    "PointError": "Error",
+    "SeriesError": "Error",
+    "SimpleStats": "Stats",
+    "interpolate": "utils",
+}
+__getattr__, __dir__, __all__ = attach(__name__, _submodules, _attrs)
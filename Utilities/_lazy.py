@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Lazy submodule loading for the Utilities packages."""
+
+__author__ = "James Daniell"
+__copyright__ = ""
+__credits__ = ["James Daniell"]
+__license__ = ""
+__version__ = "0.1"
+__maintainer__ = "James Daniell"
+__email__ = "jnathandaniell@gmail.com"
+__status__ = "Development"
+
+
+import importlib
+import sys
+
+
+def attach(package: str, submodules: tuple, attrs: dict) -> tuple:
+    """Build module-level __getattr__, __dir__ and __all__ for a package.
+
+    Submodules are imported on first access, and each name in attrs is
+    fetched from the submodule it maps to and cached on the package.
+    """
+    __all__ = [*submodules, *attrs]
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module("." + name, package)
+        if name in attrs:
+            module = importlib.import_module("." + attrs[name], package)
+            value = getattr(module, name)
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted({*vars(sys.modules[package]), *__all__})
+
+    return __getattr__, __dir__, __all__
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Plotting helpers, imported lazily so matplotlib loads on first use."""
+
+__author__ = "James Daniell"
+__copyright__ = ""
+__credits__ = ["James Daniell"]
+__license__ = ""
+__version__ = "0.1"
+__maintainer__ = "James Daniell"
+__email__ = "jnathandaniell@gmail.com"
+__status__ = "Development"
+
+
+from .._lazy import attach
+
+
+_submodules = ("surfaceplot",)
+_attrs = {
+    "get_surface_plot": "surfaceplot",
+}
+__getattr__, __dir__, __all__ = attach(__name__, _submodules, _attrs)
@@ -4,11 +4,13 @@
 """3d surface plotter."""
 
 
-from matplotlib import pyplot as plt
+from ..profiling import instrument
 
 
+@instrument
 def get_surface_plot(xyz: tuple, **kwargs):
     """Plots a surface given a vertically stacked xyz vector."""
+    from matplotlib import pyplot as plt
     fig = plt.figure()
     ax = fig.add_subplot(projection = '3d')
     x, y, z = xyz[0], xyz[1], xyz[2]
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Opt-in profiling of the hot paths in the Utilities package.
+
+Entry points decorated with 'instrument' record call counts, wall time,
+element counts and (optionally) allocation size while profiling is on.
+Profiling is switched on either by setting the UTILITIES_PROFILE
+environment variable before import, or with the 'profiling' context
+manager:
+
+    with profiling(trace="run.json") as prof:
+        SeriesError(X, Y, err_type="sq")
+    print(prof.format_summary())
+
+UTILITIES_PROFILE=1 records timings, UTILITIES_PROFILE=memory also traces
+allocations. At exit the summary is printed to stderr, or a Chrome trace is
+written if UTILITIES_PROFILE_TRACE names a file.
+
+Methods of instrumented classes are only swapped for timed versions while
+profiling is on, so per-point calls such as PointError.calc_error run the
+original functions when it is off. Module-level functions keep a thin
+wrapper which only checks a flag when profiling is off.
+"""
+
+__author__ = "James Daniell"
+__copyright__ = ""
+__credits__ = ["James Daniell"]
+__license__ = ""
+__version__ = "0.1"
+__maintainer__ = "James Daniell"
+__email__ = "jnathandaniell@gmail.com"
+__status__ = "Development"
+
+
+import atexit
+import os
+import sys
+from _thread import allocate_lock, get_ident
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+ENV_VAR = "UTILITIES_PROFILE"
+TRACE_ENV_VAR = "UTILITIES_PROFILE_TRACE"
+
+# Method names picked up by instrumented classes.
+HOT_PREFIXES = ("calc_", "build_")
+HOT_NAMES = ("pdf", "get_point_errors")
+
+_enabled = False
+_started_tracemalloc = False
+# Imported by enable(memory=True); tracemalloc is slow to import.
+tracemalloc = None
+_classes = []
+_patched = []
+
+
+class Profiler():
+    """Collects call records from instrumented functions.
+
+    Keeps a running summary per function and, up to max_events, the
+    individual calls for a Chrome trace. Wall times are inclusive, so a
+    function's time contains that of the instrumented calls it makes.
+    """
+
+    def __init__(self, max_events=1000000) -> None:
+        self.max_events = max_events
+        self.memory = False
+        self.traced = False
+        self.lock = allocate_lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all recorded calls."""
+        self.stats = {}
+        self.events = []
+        self.dropped = 0
+        self.traced = self.memory
+        self.t0 = time.perf_counter_ns()
+
+    def record(self, name, start, end, elements, alloc) -> None:
+        """Adds one call, with start/end in perf_counter nanoseconds."""
+        with self.lock:
+            s = self.stats.get(name)
+            if s is None:
+                s = self.stats[name] = {"calls": 0, "total_ns": 0,
+                                        "max_ns": 0, "elements": 0,
+                                        "alloc_bytes": 0}
+            dur = end - start
+            s["calls"] += 1
+            s["total_ns"] += dur
+            s["max_ns"] = max(s["max_ns"], dur)
+            s["elements"] += elements
+            s["alloc_bytes"] += alloc
+            if len(self.events) < self.max_events:
+                self.events.append((name, start, dur, get_ident(),
+                                    elements, alloc))
+            else:
+                self.dropped += 1
+
+    def summary(self) -> dict:
+        """Return per-function totals, slowest first."""
+        out = {}
+        for name, s in sorted(self.stats.items(),
+                              key=lambda kv: -kv[1]["total_ns"]):
+            out[name] = {
+                "calls": s["calls"],
+                "total_s": s["total_ns"] / 1e9,
+                "mean_s": s["total_ns"] / s["calls"] / 1e9,
+                "max_s": s["max_ns"] / 1e9,
+                "elements": s["elements"],
+                "alloc_bytes": s["alloc_bytes"] if self.traced else None,
+            }
+        return out
+
+    def format_summary(self) -> str:
+        """Return the summary as a printable table."""
+        lines = [f"{'function':60s} {'calls':>10s} {'total s':>10s} "
+                 f"{'mean s':>10s} {'elements':>12s} {'alloc B':>12s}"]
+        for name, s in self.summary().items():
+            alloc = "-" if s["alloc_bytes"] is None else s["alloc_bytes"]
+            lines.append(f"{name:60s} {s['calls']:10d} {s['total_s']:10.4g} "
+                         f"{s['mean_s']:10.3g} {s['elements']:12d} "
+                         f"{alloc:>12}")
+        if self.dropped:
+            lines.append(f"({self.dropped} calls left out of the trace)")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Return recorded calls in Chrome trace event format."""
+        pid = os.getpid()
+        events = [{"name": name, "cat": name.rsplit(".", 1)[0], "ph": "X",
+                   "ts": (start - self.t0) / 1e3, "dur": dur / 1e3,
+                   "pid": pid, "tid": tid,
+                   "args": {"elements": elements, "alloc_bytes": alloc}}
+                  for name, start, dur, tid, elements, alloc in self.events]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path) -> None:
+        """Write a trace viewable in chrome://tracing or Perfetto."""
+        import json
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+profiler = Profiler()
+
+
+#####################
+##### Recording #####
+#####################
+def _points(a) -> int:
+    """Number of data points in a, or 0 if it holds none."""
+    if isinstance(a, (list, tuple)):
+        # A tuple of arrays (e.g. a meshgrid) covers the points of one.
+        first = _points(a[0]) if a else 0
+        return first if first > 1 else len(a)
+    if isinstance(getattr(a, "size", None), int):
+        # Stacked x/y/z (or x/y/loc/z) rows hold one point per column.
+        if a.ndim == 2 and a.shape[0] <= 4:
+            return a.shape[-1]
+        return a.size
+    if isinstance(getattr(a, "N", None), int):
+        return a.N
+    return 0
+
+def count_elements(args, result) -> int:
+    """Estimate how many data points a call touched.
+
+    Uses the largest point count among the arguments and the result: the
+    length of a list, the number of columns of a stacked x/y/z array, the
+    size of any other array, or the 'N' sample count of an object. Scalar calls
+    count 1.
+    """
+    return max(1, *(_points(a) for a in (*args, result)))
+
+def timed(func, name=None):
+    """Return a version of func which always records its calls."""
+    name = name or func.__module__ + "." + func.__qualname__
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        memory = profiler.memory
+        if memory:
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        end = time.perf_counter_ns()
+        alloc = 0
+        if memory:
+            alloc = max(0, tracemalloc.get_traced_memory()[0] - before)
+        profiler.record(name, start, end, count_elements(args, result), alloc)
+        return result
+    return wrapper
+
+def _patch(cls) -> None:
+    """Swap the hot methods of cls for timed versions."""
+    for attr, val in list(vars(cls).items()):
+        if callable(val) and (attr.startswith(HOT_PREFIXES)
+                              or attr in HOT_NAMES):
+            setattr(cls, attr, timed(val))
+            _patched.append((cls, attr, val))
+
+def instrument(obj):
+    """Decorator marking a function or class as a profiled entry point.
+
+    A class has its calc_*, build_*, pdf and get_point_errors methods timed
+    while profiling is on and left untouched otherwise. A function is
+    wrapped so it records its calls while profiling is on.
+    """
+    if isinstance(obj, type):
+        _classes.append(obj)
+        if _enabled:
+            _patch(obj)
+        return obj
+    func = obj
+    recorded = timed(func)
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _enabled:
+            return recorded(*args, **kwargs)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+#####################
+##### Switching #####
+#####################
+def _set_memory(memory: bool) -> None:
+    """Switch allocation tracing on or off.
+
+    Starts tracemalloc if needed, and stops it again only if it was started
+    here, so tracing begun by the caller is left alone.
+    """
+    global _started_tracemalloc, tracemalloc
+    if memory and tracemalloc is None:
+        import tracemalloc
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    elif not memory and _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+    profiler.memory = memory
+    profiler.traced = profiler.traced or memory
+
+def enable(memory=False) -> None:
+    """Turn profiling on, optionally tracing allocations too."""
+    global _enabled
+    _set_memory(memory)
+    if not _enabled:
+        _enabled = True
+        for cls in _classes:
+            _patch(cls)
+
+def disable() -> None:
+    """Turn profiling off and restore the original methods."""
+    global _enabled
+    _set_memory(False)
+    _enabled = False
+    while _patched:
+        cls, attr, val = _patched.pop()
+        setattr(cls, attr, val)
+
+def is_enabled() -> bool:
+    """Return whether profiling is on."""
+    return _enabled
+
+@contextmanager
+def profiling(trace=None, memory=False, reset=None):
+    """Profile the enclosed block and yield the profiler.
+
+    Writes a Chrome trace to 'trace' on exit if given. If profiling was
+    already on when the block started, it is left on afterwards in the same
+    memory mode, and by default the calls recorded so far are kept.
+    """
+    was_enabled, was_memory = _enabled, profiler.memory
+    if reset is None:
+        reset = not was_enabled
+    if reset:
+        profiler.reset()
+    enable(memory=memory or was_memory)
+    try:
+        yield profiler
+    finally:
+        if was_enabled:
+            enable(memory=was_memory)
+        else:
+            disable()
+        if trace:
+            profiler.write_chrome_trace(trace)
+
+def _report() -> None:
+    """Write the trace or print the summary when the process exits."""
+    if not profiler.stats:
+        return
+    path = os.environ.get(TRACE_ENV_VAR)
+    if path:
+        profiler.write_chrome_trace(path)
+    else:
+        print(profiler.format_summary(), file=sys.stderr)
+
+
+_mode = os.environ.get(ENV_VAR, "").strip().lower()
+if _mode not in ("", "0", "false", "off"):
+    enable(memory=_mode == "memory")
+    atexit.register(_report)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Sphere data generation, imported lazily so NumPy loads on first use."""
+
+__author__ = "James Daniell"
+__copyright__ = ""
+__credits__ = ["James Daniell"]
+__license__ = ""
+__version__ = "0.1"
+__maintainer__ = "James Daniell"
+__email__ = "jnathandaniell@gmail.com"
+__status__ = "Development"
+
+
+from .._lazy import attach
+
+
+_submodules = ("sphere_generator",)
+_attrs = {
+    "build_sphere": "sphere_generator",
+    "build_local_sphere": "sphere_generator",
+    "build_full_sphere": "sphere_generator",
+    "add_noise": "sphere_generator",
+}
+__getattr__, __dir__, __all__ = attach(__name__, _submodules, _attrs)
@@ -7,7 +7,10 @@
 import numpy as np
 from math import sqrt, pow
 
+from ..profiling import instrument
 
+
+@instrument
 def build_mesh(r: float, n: int) -> tuple:
     """Builds a meshgrid with x and y coordinates."""
     x = np.linspace(0, r, n)
@@ -25,6 +28,7 @@ def get_z(x: float, y: float, r: float) -> float:
     else:
         return -1.
 
+@instrument
 def get_xyz(xy_array: np.ndarray) -> np.ndarray:
     """Gets an x/y/z vector with valid values."""
     get_z_vect = np.vectorize(get_z)
@@ -35,6 +39,7 @@ def get_xyz(xy_array: np.ndarray) -> np.ndarray:
     xyz_array = np.vstack((xy_array, z))
     return xyz_array[:, xyz_array[-1,:] >= 0.]
 
+@instrument
 def build_local_sphere(r: float, n: int) -> np.ndarray:
     """Builds a sphere end-to-end."""
     x, y = build_mesh(r, n)
@@ -52,6 +57,7 @@ def add_noise(xyz: np.ndarray, mu=0., sigma=1, err=0.05) -> np.ndarray:
 #######################
 ##### Full Sphere #####
 #######################
+@instrument
 def build_hemi_mesh(r: float, n: int) -> tuple:
     """Builds a hemisphere meshgrid with x and y coordinates."""
     half_n = int(n/2)
@@ -81,6 +87,7 @@ def get_z_full(x: float, y: float, loc: bool, r: float) -> float:
         # Dummy output to be removed.
         return np.inf
 
+@instrument
 def get_full_xyz(xy_array: np.ndarray) -> np.ndarray:
     """Gets an x/y/z vector with valid values."""
     get_z_vect = np.vectorize(get_z_full)
@@ -92,6 +99,7 @@ def get_full_xyz(xy_array: np.ndarray) -> np.ndarray:
     xyz_array = np.vstack((xy_array, z))
     return xyz_array[:, xyz_array[-1,:] != np.inf]
 
+@instrument
 def build_full_sphere(r: float, n: int) -> np.ndarray:
     """Builds a sphere end-to-end."""
     x, y = build_hemi_mesh(r, n)
@@ -101,6 +109,7 @@ def build_full_sphere(r: float, n: int) -> np.ndarray:
 ##########################
 ##### Builder Helper #####
 ##########################
+@instrument
 def build_sphere(r: float, n: int, full=False):
     """Helper function for building a sphere."""
     if full:
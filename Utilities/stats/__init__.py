@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Special distributions and statistical functions, imported lazily."""
+
+__author__ = "James Daniell"
+__copyright__ = ""
+__credits__ = ["James Daniell"]
+__license__ = ""
+__version__ = "0.1"
+__maintainer__ = "James Daniell"
+__email__ = "jnathandaniell@gmail.com"
+__status__ = "Development"
+
+
+from .._lazy import attach
+
+
+_submodules = ("continuous_distributions", "discrete_distributions",
+               "stat_funcs")
+_attrs = {
+    "Uniform": "continuous_distributions",
+    "Normal": "continuous_distributions",
+    "Gamma": "continuous_distributions",
+    "Exponential": "continuous_distributions",
+    "TwoParamExp": "continuous_distributions",
+    "DoubleExp": "continuous_distributions",
+    "Weibull": "continuous_distributions",
+    "permutations": "stat_funcs",
+    "combinations": "stat_funcs",
+    "approximate_cdf": "stat_funcs",
+}
+__getattr__, __dir__, __all__ = attach(__name__, _submodules, _attrs)
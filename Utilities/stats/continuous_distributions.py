@@ -6,7 +6,10 @@
 
 from math import pow, exp, sqrt, pi, gamma
 
+from ..profiling import instrument
 
+
+@instrument
 class Uniform():
     """Uniform distribution."""
 
@@ -34,6 +37,7 @@ class Uniform():
         return (exp(self.b * t) - exp(self.a * t)) / ((self.b - self.a) * t)
 
 
+@instrument
 class Normal():
     """Normal distribution."""
 
@@ -63,6 +67,7 @@ class Normal():
         return exp(self.mu * t + pow(self.sig, 2) * pow(t, 2) / 2)
 
 
+@instrument
 class Gamma():
     """Gamma distribution."""
 
@@ -93,6 +98,7 @@ class Gamma():
         return pow((1 / (1 - self.theta * t)), self.k)
 
 
+@instrument
 class Exponential():
     """Exponential distribution."""
 
@@ -118,6 +124,7 @@ class Exponential():
         return 1 / (1 - self.theta * t)
 
 
+@instrument
 class TwoParamExp():
     """Two-Parameter Exponential distribution."""
 
@@ -145,6 +152,7 @@ class TwoParamExp():
         return exp(self.nu * t) / (1 - self.theta * t)
 
 
+@instrument
 class DoubleExp():
     """Double Exponential distribution."""
 
@@ -172,6 +180,7 @@ class DoubleExp():
         return exp(self.nu * t) / (1 - pow(self.theta, 2) * pow(t, 2))
 
 
+@instrument
 class Weibull():
     """Weibull distribution."""
 
@@ -0,0 +1,511 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Offline benchmark suite for the Utilities package.
+
+Times and measures peak memory of the public entry points in Error, Stats,
+stats.continuous_distributions, stats.stat_funcs and
+spheres.sphere_generator over input sizes from 10^3 to 10^7. Results are
+written as JSON so runs from different commits can be compared, and a
+baseline file may be given to flag regressions. Cold import times are
+also recorded with -X importtime, for reference only; tests/test_imports.py
+checks that lightweight modules don't load NumPy, matplotlib or SciPy.
+
+Example:
+    python benchmarks/bench_utilities.py -o bench.json
+    python benchmarks/bench_utilities.py --compare bench.json --plot bench.png
+"""
+
+__author__ = "James Daniell"
+__copyright__ = ""
+__credits__ = ["James Daniell"]
+__license__ = ""
+__version__ = "0.1"
+__maintainer__ = "James Daniell"
+__email__ = "jnathandaniell@gmail.com"
+__status__ = "Development"
+
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from math import log, sqrt
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+# Shortest total time of one timed measurement, as in timeit's autorange.
+MIN_TIME = 0.2
+
+# Per-call times below this many seconds are too noisy to flag.
+NOISE_FLOOR = 1e-3
+
+
+##########################
+##### Input Builders #####
+##########################
+def _linspace(a: float, b: float, n: int) -> list:
+    """Pure python linspace so the scalar benchmarks don't need NumPy."""
+    step = (b - a) / max(n - 1, 1)
+    return [a + i * step for i in range(n)]
+
+def _series(n: int) -> tuple:
+    """Forecast/actual lists shaped the way SeriesError unpacks them."""
+    X = _linspace(1., 2., n)
+    Y = [x * 1.01 for x in X]
+    return [X], [Y]
+
+def _bare(cls, **attrs):
+    """Instance of cls with attrs set and __init__ skipped.
+
+    Lets a single calc_* method be timed on its own, without the rest of
+    the constructor pipeline.
+    """
+    obj = cls.__new__(cls)
+    for key, val in attrs.items():
+        setattr(obj, key, val)
+    return obj
+
+def _series_error(n: int, stage: str):
+    """Bare SeriesError prepared up to (but not including) a stage."""
+    from Utilities.Error import SeriesError
+    X, Y = _series(n)
+    obj = _bare(SeriesError, X=X, Y=Y, N=n, err_type="sq")
+    if stage == "get_point_errors":
+        return obj
+    obj.get_point_errors()
+    if stage == "calc_errors":
+        return obj
+    obj.calc_errors()
+    return obj
+
+def _simple_stats(n: int):
+    """Bare SimpleStats with sum and mean already filled in."""
+    from Utilities.Stats import SimpleStats
+    X = _linspace(0., 1., n)
+    obj = _bare(SimpleStats, X=X, N=n)
+    obj.calc_sum()
+    obj.calc_mean()
+    return obj
+
+def _pdf_case(name: str, x_range: tuple, no_x=False):
+    """Case evaluating a continuous distribution's pdf at n points."""
+    def setup(n):
+        from Utilities.stats import continuous_distributions as cd
+        return getattr(cd, name)(), _linspace(*x_range, n)
+    if no_x:
+        def run(args):
+            dist, xs = args
+            return [dist.pdf() for _ in xs]
+    else:
+        def run(args):
+            dist, xs = args
+            return [dist.pdf(x) for x in xs]
+    return setup, run
+
+def _stat_func_case(name: str):
+    """Case calling a stat_funcs combinatoric n times with small operands."""
+    def setup(n):
+        from Utilities.stats import stat_funcs
+        pairs = [(20 + i % 50, i % 20) for i in range(n)]
+        return getattr(stat_funcs, name), pairs
+    def run(args):
+        func, pairs = args
+        return [func(a, b) for a, b in pairs]
+    return setup, run
+
+def _sphere_case(full: bool):
+    """Case building a sphere with roughly n mesh points."""
+    def setup(n):
+        from Utilities.spheres.sphere_generator import build_sphere
+        # The full sphere meshes (n/2)^2 points per hemisphere.
+        side = round(sqrt(2 * n)) if full else round(sqrt(n))
+        return build_sphere, side
+    def run(args):
+        build_sphere, side = args
+        return build_sphere(10., side, full=full)
+    return setup, run
+
+def _noise_case():
+    """Case adding noise to a sphere with roughly n points."""
+    def setup(n):
+        from Utilities.spheres.sphere_generator import add_noise
+        import numpy as np
+        xyz = np.ones((3, n))
+        return add_noise, xyz
+    def run(args):
+        add_noise, xyz = args
+        return add_noise(xyz)
+    return setup, run
+
+
+#################
+##### Cases #####
+#################
+def _method(builder, method: str, *margs):
+    """Case calling a method on the object produced by builder(n)."""
+    def run(obj):
+        return getattr(obj, method)(*margs)
+    return builder, run
+
+def _point_errors(args):
+    """Build one PointError per forecast/actual pair."""
+    from Utilities.Error import PointError
+    X, Y = args
+    return [PointError(x, y, err_type="sq") for x, y in zip(*X, *Y)]
+
+def _series_error_init(args):
+    """Run the full SeriesError constructor."""
+    from Utilities.Error import SeriesError
+    return SeriesError(*args, err_type="sq")
+
+def _simple_stats_init(X):
+    """Run the full SimpleStats constructor."""
+    from Utilities.Stats import SimpleStats
+    return SimpleStats(X)
+
+CASES = {
+    "Error.PointError": (_series, _point_errors),
+    "Error.SeriesError": (_series, _series_error_init),
+    "Error.SeriesError.get_point_errors": _method(
+        lambda n: _series_error(n, "get_point_errors"), "get_point_errors"),
+    "Error.SeriesError.calc_errors": _method(
+        lambda n: _series_error(n, "calc_errors"), "calc_errors"),
+    "Error.SeriesError.calc_stats": _method(
+        lambda n: _series_error(n, "calc_stats"), "calc_stats"),
+    "Stats.SimpleStats": (lambda n: _linspace(0., 1., n), _simple_stats_init),
+    "Stats.SimpleStats.calc_sum": _method(_simple_stats, "calc_sum"),
+    "Stats.SimpleStats.calc_stdev": _method(_simple_stats, "calc_stdev"),
+    "Stats.SimpleStats.calc_range": _method(_simple_stats, "calc_range"),
+    "Stats.SimpleStats.calc_median": _method(_simple_stats, "calc_median"),
+    "Stats.SimpleStats.calc_mode": _method(_simple_stats, "calc_mode"),
+    "Stats.SimpleStats.calc_percentile": _method(
+        _simple_stats, "calc_percentile", 90),
+    "Stats.SimpleStats.calc_pct_of_val": _method(
+        _simple_stats, "calc_pct_of_val", 0.5),
+    "stats.Uniform.pdf": _pdf_case("Uniform", (0., 1.), no_x=True),
+    "stats.Normal.pdf": _pdf_case("Normal", (-5., 5.)),
+    "stats.Gamma.pdf": _pdf_case("Gamma", (0.01, 10.)),
+    "stats.Exponential.pdf": _pdf_case("Exponential", (0., 10.)),
+    "stats.TwoParamExp.pdf": _pdf_case("TwoParamExp", (0., 10.)),
+    "stats.DoubleExp.pdf": _pdf_case("DoubleExp", (-10., 10.)),
+    "stats.Weibull.pdf": _pdf_case("Weibull", (0.01, 10.)),
+    "stats.permutations": _stat_func_case("permutations"),
+    "stats.combinations": _stat_func_case("combinations"),
+    "spheres.build_sphere": _sphere_case(full=False),
+    "spheres.build_sphere_full": _sphere_case(full=True),
+    "spheres.add_noise": _noise_case(),
+}
+
+
+#######################
+##### Measurement #####
+#######################
+def time_case(run, args, repeat: int) -> float:
+    """Return the best per-call wall time of run(args).
+
+    One warm-up call is made first so import and first-call costs stay out
+    of the result. Short calls are then looped for at least MIN_TIME
+    seconds per measurement, as timeit.Timer.autorange does, and the total
+    divided by the loop count.
+    """
+    timer = timeit.Timer(lambda: run(args))
+    gc.collect()
+    warm = timer.timeit(1)
+    if warm >= MIN_TIME:
+        # Long calls have no first-call cost worth excluding, so the
+        # warm-up doubles as the first measurement.
+        return min([warm] + timer.repeat(repeat - 1, 1))
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat, loops)) / loops
+
+def peak_memory(run, args) -> int:
+    """Return the peak traced allocation of a single run, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        run(args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+def fit_exponent(sizes: list, times: list):
+    """Least squares slope of log(time) against log(size).
+
+    An exponent of 1 means linear scaling, 2 quadratic, and so on. Returns
+    None if fewer than two usable points were measured.
+    """
+    pts = [(log(n), log(t)) for n, t in zip(sizes, times) if t and t > 0.]
+    if len(pts) < 2:
+        return None
+    mx = sum(p[0] for p in pts) / len(pts)
+    my = sum(p[1] for p in pts) / len(pts)
+    sxx = sum((p[0] - mx) ** 2 for p in pts)
+    sxy = sum((p[0] - mx) * (p[1] - my) for p in pts)
+    return sxy / sxx
+
+def predict_wall(result: dict, n: int, repeat: int) -> float:
+    """Predict the wall time of measuring size n from the last size measured.
+
+    The per-call time and the memory pass are scaled by the fitted exponent
+    (at least linear) and setup linearly. The timed runs then cost repeat
+    calls, or repeat loops of MIN_TIME for calls shorter than that; this
+    fixed overhead is added unscaled.
+    """
+    exp = max(fit_exponent(result["sizes"], result["time_s"]) or 1., 1.)
+    last_n = result["sizes"][-1]
+    grow = pow(n / last_n, exp)
+    call = result["time_s"][-1] * grow
+    timed = repeat * max(call, MIN_TIME)
+    setup = result["setup_s"][-1] * n / last_n
+    memory = (result["memory_s"][-1] or 0.) * grow
+    return timed + setup + memory
+
+def run_case(name: str, sizes: list, repeat: int, budget: float,
+             memory=True) -> dict:
+    """Measure one case across all sizes.
+
+    The input is built once per size and shared by the timed runs and the
+    memory pass, as no case modifies it. Sizes whose predicted wall time
+    (see predict_wall) exceeds budget seconds are skipped, and the first exception stops the case and is recorded in the
+    result.
+    """
+    setup, run = CASES[name]
+    result = {"sizes": [], "time_s": [], "peak_bytes": [], "setup_s": [],
+              "memory_s": [], "wall_s": [], "skipped": [], "error": None}
+    for n in sizes:
+        if result["sizes"] and predict_wall(result, n, repeat) > budget:
+            result["skipped"].append(n)
+            continue
+        start = time.perf_counter()
+        try:
+            args = setup(n)
+            set_up = time.perf_counter()
+            t = time_case(run, args, repeat)
+            timed = time.perf_counter()
+            m = peak_memory(run, args) if memory else None
+            m_time = time.perf_counter() - timed if memory else None
+        except Exception as e:
+            result["error"] = type(e).__name__ + ": " + str(e)
+            break
+        finally:
+            args = None
+        result["sizes"].append(n)
+        result["time_s"].append(t)
+        result["peak_bytes"].append(m)
+        result["setup_s"].append(set_up - start)
+        result["memory_s"].append(m_time)
+        result["wall_s"].append(time.perf_counter() - start)
+    result["exponent"] = fit_exponent(result["sizes"], result["time_s"])
+    return result
+
+def get_meta() -> dict:
+    """Collect enough context to tell two result files apart."""
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": None,
+    }
+    try:
+        meta["commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    try:
+        import numpy
+        meta["numpy"] = numpy.__version__
+    except ImportError:
+        meta["numpy"] = None
+    return meta
+
+
+########################
+##### Import Times #####
+########################
+HEAVY = ("numpy", "matplotlib", "scipy")
+
+IMPORTS = (
+    "Utilities",
+    "Utilities.Error",
+    "Utilities.Stats",
+    "Utilities.profiling",
+    "Utilities.stats",
+    "Utilities.stats.continuous_distributions",
+    "Utilities.stats.stat_funcs",
+    "Utilities.spheres",
+    "Utilities.spheres.sphere_generator",
+    "Utilities.jimmyplot",
+    "Utilities.jimmyplot.surfaceplot",
+)
+
+def import_time(module: str, repeat: int) -> dict:
+    """Measure a cold import of module with python -X importtime.
+
+    Returns the best cumulative import time in microseconds and the heavy
+    top-level packages the import loaded.
+    """
+    best = None
+    loaded = set()
+    env = {**os.environ, "UTILITIES_PROFILE": ""}
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module],
+            cwd=ROOT, env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+        cumulative = None
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cum, name = line[len("import time:"):].split("|")
+            if not cum.strip().isdigit():
+                continue
+            name = name.strip()
+            if name.split(".")[0] in HEAVY:
+                loaded.add(name.split(".")[0])
+            if name == module:
+                cumulative = int(cum)
+        if cumulative is not None and (best is None or cumulative < best):
+            best = cumulative
+    return {"cumulative_us": best, "heavy": sorted(loaded)}
+
+def run_imports(repeat: int) -> dict:
+    """Measure a cold import of every module in IMPORTS."""
+    return {module: import_time(module, repeat) for module in IMPORTS}
+
+
+######################
+##### Comparison #####
+######################
+def compare(current: dict, baseline: dict, threshold: float,
+            noise_floor=NOISE_FLOOR) -> list:
+    """List the (case, size, metric, ratio) entries slower than threshold.
+
+    A ratio is current / baseline, so a threshold of 1.25 flags anything
+    at least 25% slower or larger than the baseline run. Timings where
+    both runs are under noise_floor seconds are not flagged.
+    """
+    flagged = []
+    for name, res in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for metric in ("time_s", "peak_bytes"):
+            old = dict(zip(base["sizes"], base[metric]))
+            for n, new in zip(res["sizes"], res[metric]):
+                if not new or not old.get(n):
+                    continue
+                if metric == "time_s" and max(new, old[n]) < noise_floor:
+                    continue
+                ratio = new / old[n]
+                if ratio > threshold:
+                    flagged.append((name, n, metric, ratio))
+    return flagged
+
+def plot_scaling(results: dict, path: str) -> None:
+    """Save log-log scaling curves of time and peak memory."""
+    from matplotlib import pyplot as plt
+    fig, (ax_t, ax_m) = plt.subplots(1, 2, figsize=(14, 6))
+    for name, res in results.items():
+        if not res["sizes"]:
+            continue
+        ax_t.loglog(res["sizes"], res["time_s"], marker="o", label=name)
+        if all(m for m in res["peak_bytes"]):
+            ax_m.loglog(res["sizes"], res["peak_bytes"], marker="o")
+    ax_t.set_xlabel("N")
+    ax_t.set_ylabel("time (s)")
+    ax_m.set_xlabel("N")
+    ax_m.set_ylabel("peak memory (bytes)")
+    fig.legend(loc="lower center", ncol=4, fontsize="small")
+    fig.tight_layout(rect=(0, 0.15, 1, 1))
+    fig.savefig(path)
+
+
+###############
+##### CLI #####
+###############
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="bench_output.json",
+                        help="JSON file to write results to.")
+    parser.add_argument("-k", "--cases", nargs="*", default=None,
+                        help="Only run cases whose name contains one of "
+                             "these strings.")
+    parser.add_argument("--sizes", type=lambda s: [int(float(v)) for v in
+                                                   s.split(",")],
+                        default=list(DEFAULT_SIZES),
+                        help="Comma separated input sizes, e.g. 1e3,1e5.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per size; the best is kept.")
+    parser.add_argument("--budget", type=float, default=30.,
+                        help="Skip sizes predicted to take longer than "
+                             "this many seconds.")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the tracemalloc peak memory pass.")
+    parser.add_argument("--no-imports", action="store_true",
+                        help="Skip the -X importtime measurements.")
+    parser.add_argument("--compare", default=None,
+                        help="Baseline JSON to check for regressions.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Current/baseline ratio counted as a "
+                             "regression.")
+    parser.add_argument("--noise-floor", type=float, default=NOISE_FLOOR,
+                        help="Per-call seconds below which timings are "
+                             "not compared.")
+    parser.add_argument("--plot", default=None,
+                        help="Save scaling curves to this image file.")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    names = [name for name in CASES
+             if args.cases is None or any(k in name for k in args.cases)]
+    output = {"meta": get_meta(), "results": {}}
+    for name in names:
+        res = run_case(name, sorted(args.sizes), args.repeat, args.budget,
+                       memory=not args.no_memory)
+        output["results"][name] = res
+        exp = res["exponent"]
+        print(f"{name:40s} "
+              + " ".join(f"{n:.0e}:{t:.3g}s"
+                         for n, t in zip(res["sizes"], res["time_s"]))
+              + (f"  exp={exp:.2f}" if exp is not None else "")
+              + (f"  ERROR {res['error']}" if res["error"] else ""))
+    if not args.no_imports:
+        output["imports"] = run_imports(args.repeat)
+        for module, res in output["imports"].items():
+            print(f"{module:40s} import {res['cumulative_us']}us"
+                  + (f"  loads {', '.join(res['heavy'])}"
+                     if res["heavy"] else ""))
+    with open(args.output, "w") as f:
+        json.dump(output, f, indent=2)
+    if args.plot:
+        plot_scaling(output["results"], args.plot)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        flagged = compare(output, baseline, args.threshold,
+                          args.noise_floor)
+        for name, n, metric, ratio in flagged:
+            print(f"REGRESSION {name} N={n} {metric} x{ratio:.2f}")
+        return 1 if flagged else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Checks the benchmark suite's scaling fit, budget and regression logic."""
+
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "benchmarks"))
+
+import bench_utilities as bench
+
+
+def result(sizes, times, peaks=None, setup=None, memory=None) -> dict:
+    """Hand-built run_case result."""
+    n = len(sizes)
+    return {"sizes": sizes, "time_s": times,
+            "peak_bytes": peaks or [None] * n,
+            "setup_s": setup or [0.] * n, "memory_s": memory or [None] * n}
+
+def run(**results) -> dict:
+    """Hand-built benchmark output with the given case results."""
+    return {"meta": {}, "results": results}
+
+
+@pytest.mark.parametrize("exp", [0.5, 1., 2.])
+def test_fit_exponent_recovers_power_law(exp):
+    sizes = [10**3, 10**4, 10**5, 10**6]
+    times = [3e-6 * pow(n, exp) for n in sizes]
+    assert bench.fit_exponent(sizes, times) == pytest.approx(exp)
+
+def test_fit_exponent_needs_two_points():
+    assert bench.fit_exponent([1000], [0.1]) is None
+    assert bench.fit_exponent([1000, 10000], [0.1, 0.]) is None
+
+def test_compare_flags_slowdown_above_threshold():
+    base = run(case=result([1000, 10000], [0.01, 0.1]))
+    cur = run(case=result([1000, 10000], [0.011, 0.2]))
+    assert bench.compare(cur, base, 1.25) == [("case", 10000, "time_s", 2.)]
+
+def test_compare_skips_timings_under_noise_floor():
+    base = run(case=result([1000], [1e-5]))
+    cur = run(case=result([1000], [1e-4]))
+    assert bench.compare(cur, base, 1.25) == []
+    assert bench.compare(cur, base, 1.25, noise_floor=1e-6) == [
+        ("case", 1000, "time_s", pytest.approx(10.))]
+
+def test_compare_flags_peak_memory_growth():
+    base = run(case=result([1000], [0.1], peaks=[1000]))
+    cur = run(case=result([1000], [0.1], peaks=[2000]))
+    assert bench.compare(cur, base, 1.25) == [("case", 1000, "peak_bytes", 2.)]
+
+def test_compare_ignores_missing_sizes_cases_and_memory():
+    base = run(case=result([1000], [0.1]))
+    cur = run(case=result([1000, 10000], [0.1, 5.]),
+              new_case=result([1000], [9.]))
+    assert bench.compare(cur, base, 1.25) == []
+
+def test_predict_wall_does_not_scale_fixed_overhead():
+    res = result([1000], [1e-4], setup=[0.01], memory=[0.001])
+    # 3 MIN_TIME loops + 10x setup + 10x memory pass.
+    assert bench.predict_wall(res, 10000, 3) == pytest.approx(
+        3 * bench.MIN_TIME + 0.1 + 0.01)
+    # Calls longer than MIN_TIME run once per repeat.
+    assert bench.predict_wall(res, 10**7, 3) == pytest.approx(
+        3 * 1. + 100. + 10.)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Checks that importing lightweight Utilities modules stays lightweight."""
+
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ("numpy", "matplotlib", "scipy")
+
+# Standard library modules the scoring workers' imports must not load.
+WORKER_EXCLUDED = ("threading", "tracemalloc", "json")
+
+# Cold imports of Error and Stats may take at most this multiple of a cold
+# 'import json' in the same environment.
+REFERENCE = "json"
+MAX_RATIO = 2.
+
+# Best of this many fresh interpreters is taken for each timing.
+TIMING_RUNS = 5
+
+LIGHT_IMPORTS = (
+    "Utilities",
+    "Utilities.Error, Utilities.Stats",
+    "Utilities.profiling",
+    "Utilities.utils",
+    "Utilities.stats",
+    "Utilities.stats.continuous_distributions",
+    "Utilities.stats.stat_funcs",
+    "Utilities.spheres",
+    "Utilities.jimmyplot",
+    "Utilities.jimmyplot.surfaceplot",
+)
+
+
+def imported_modules(code: str) -> set:
+    """Run code in a fresh interpreter and list the modules it imported.
+
+    Combines what -X importtime logged with the final sys.modules, since
+    submodules loaded through importlib.import_module are not logged.
+    """
+    env = {**os.environ, "UTILITIES_PROFILE": ""}
+    code += "\nimport sys; print('\\n'.join(sys.modules))"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    modules = set(proc.stdout.split())
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:"):
+            modules.add(line.rsplit("|", 1)[-1].strip())
+    return modules
+
+def import_time(modules: tuple) -> int:
+    """Best cumulative microseconds to import modules in a fresh interpreter."""
+    env = {**os.environ, "UTILITIES_PROFILE": ""}
+    code = "import " + ", ".join(modules)
+    best = None
+    for _ in range(TIMING_RUNS):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=ROOT, env=env, capture_output=True, text=True)
+        assert proc.returncode == 0, proc.stderr
+        total = 0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line.split("|")
+            # Nested imports are indented past the single leading space.
+            if name[1] != " " and name.strip() in modules:
+                total += int(cumulative)
+        best = total if best is None else min(best, total)
+    return best
+
+def heavy_loaded(modules: set) -> list:
+    """Return the heavy top-level packages among modules."""
+    return sorted({m.split(".")[0] for m in modules} & set(HEAVY))
+
+
+@pytest.mark.parametrize("targets", LIGHT_IMPORTS)
+def test_light_import_skips_heavy_dependencies(targets):
+    modules = imported_modules("import " + targets)
+    assert heavy_loaded(modules) == []
+
+def test_lazy_attribute_loads_submodule():
+    modules = imported_modules(
+        "import Utilities; Utilities.SimpleStats; Utilities.stats.Normal")
+    assert "Utilities.Stats" in modules
+    assert "Utilities.stats.continuous_distributions" in modules
+    assert "Utilities.Error" not in modules
+    assert heavy_loaded(modules) == []
+
+def test_worker_imports_skip_excluded_stdlib():
+    modules = imported_modules("import Utilities.Error, Utilities.Stats")
+    assert sorted(modules & set(WORKER_EXCLUDED)) == []
+
+def test_worker_import_time_within_reference():
+    worker = import_time(("Utilities.Error", "Utilities.Stats"))
+    reference = import_time((REFERENCE,))
+    assert worker <= MAX_RATIO * reference, (worker, reference)
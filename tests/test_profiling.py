@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Checks the opt-in profiling layer."""
+
+
+import tracemalloc
+
+import pytest
+
+from Utilities import profiling as prof
+from Utilities.Error import PointError
+from Utilities.stats.continuous_distributions import Normal
+
+
+@pytest.fixture(autouse=True)
+def profiling_off():
+    """Start and finish every test with profiling off and no records."""
+    prof.disable()
+    prof.profiler.reset()
+    yield
+    prof.disable()
+    prof.profiler.reset()
+
+
+def test_enable_disable_restore_original_methods():
+    originals = (PointError.calc_error, Normal.pdf)
+    prof.enable()
+    assert PointError.calc_error is not originals[0]
+    assert Normal.pdf is not originals[1]
+    prof.disable()
+    assert (PointError.calc_error, Normal.pdf) == originals
+    assert PointError.calc_error is originals[0]
+
+def test_disable_when_off_does_not_patch():
+    calls = []
+    original = prof._patch
+    prof._patch = calls.append
+    try:
+        prof.disable()
+    finally:
+        prof._patch = original
+    assert calls == []
+    assert not prof.is_enabled()
+
+def test_calls_are_recorded_only_while_enabled():
+    PointError(1., 2., err_type="sq")
+    assert prof.profiler.stats == {}
+    with prof.profiling() as p:
+        PointError(1., 2., err_type="sq")
+    stats = p.summary()
+    assert stats["Utilities.Error.PointError.calc_error"]["calls"] == 1
+    assert stats["Utilities.Error.PointError.calc_err"]["alloc_bytes"] is None
+
+def test_memory_block_stops_tracemalloc():
+    assert not tracemalloc.is_tracing()
+    with prof.profiling(memory=True) as p:
+        assert tracemalloc.is_tracing()
+        PointError(1., 2., err_type="sq")
+    assert not tracemalloc.is_tracing()
+    assert not p.memory
+    assert p.summary()["Utilities.Error.PointError.calc_error"][
+        "alloc_bytes"] is not None
+    with prof.profiling():
+        assert not tracemalloc.is_tracing()
+
+def test_nested_block_keeps_outer_stats_and_memory_mode():
+    prof.enable()
+    Normal().pdf(0.)
+    with prof.profiling(memory=True):
+        assert tracemalloc.is_tracing()
+        Normal().pdf(1.)
+    assert prof.is_enabled()
+    assert not prof.profiler.memory
+    assert not tracemalloc.is_tracing()
+    name = "Utilities.stats.continuous_distributions.Normal.pdf"
+    assert prof.profiler.stats[name]["calls"] == 2
+
+def test_chrome_trace_events():
+    with prof.profiling() as p:
+        Normal().pdf(0.)
+    events = p.chrome_trace()["traceEvents"]
+    assert len(events) == 1
+    event = events[0]
+    assert event["ph"] == "X"
+    assert event["ts"] >= 0 and event["dur"] >= 0
+    assert event["args"]["elements"] == 1
+
+def test_count_elements_arrays():
+    np = pytest.importorskip("numpy")
+    xyz = np.zeros((3, 50))
+    assert prof.count_elements((xyz,), None) == 50
+    mesh = np.meshgrid(np.zeros(10), np.zeros(20))
+    assert prof.count_elements((1., 10), mesh) == 200
+    assert prof.count_elements(([0.] * 7,), 1.) == 7
+    assert prof.count_elements((0.5,), 0.1) == 1